@@ -1,17 +1,20 @@
 from __future__ import annotations
 
 from pathlib import Path
-from datetime import datetime, date
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, date, timedelta
+from functools import lru_cache
+import hashlib
 import json
 import math
+import os
+import re
 import shutil
+import tempfile
 
-import openpyxl
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import plotly.io as pio
 from jinja2 import Template
+from markupsafe import escape
 
 
 # ---------------------------
@@ -22,6 +25,11 @@ SHEET_DASHBOARD = "Dashboard"
 SHEET_INVENTORY = "INVENTORY"
 SHEET_SALES = "Sales"
 
+# pandas read_excel engine; calamine (Rust) is much faster than openpyxl for pure reads
+EXCEL_ENGINE = "calamine"
+# Only truly empty cells are missing; text such as "NA" or "None" is kept as typed
+SHEET_PARSE_OPTS = {"header": None, "keep_default_na": False, "na_values": [""]}
+
 # Sales sheet — displayed columns (in order). Drop columns that are mostly empty.
 SALES_DISPLAY_COLS = [
     "Date",
@@ -59,6 +67,14 @@ C_GREEN  = "#16a34a"
 C_RED    = "#dc2626"
 C_AMBER  = "#d97706"
 
+# Plotly options passed to every Plotly.newPlot call in the dashboard template
+PLOTLY_CONFIG = {"responsive": True, "displayModeBar": False}
+# Layout shared by Plotly figures; each figure adds its own title/axes on top
+PLOTLY_BASE_LAYOUT = dict(
+    margin=dict(l=40, r=20, t=50, b=80),
+    legend=dict(orientation="h", yanchor="top", y=-0.18, xanchor="center", x=0.5),
+)
+
 # Category qty: header row 46, data 47-49, cols F-H
 CATQTY_HEADER_ROW = 46
 CATQTY_DATA_ROWS = (47, 49)
@@ -79,6 +95,12 @@ CASH_HEADER_ROW = 25
 CASH_DATA_ROWS = (26, 28)
 CASH_COLS = (1, 7)  # A-F
 
+# Columns each chart needs; the chart is replaced by a notice if any are missing
+_MONTH_REQ = frozenset({"Month", "Purchases (₹)", "Sales (₹)"})
+_PROFIT_REQ = frozenset({"Month", MONTH_PROFIT_COL})
+_CATQTY_REQ = frozenset({"Category", "Qty Sold", "Qty Pending"})
+_PENDVAL_REQ = frozenset({"Category", "Pending Value (₹)"})
+
 
 # ---------------------------
 # Helpers
@@ -92,7 +114,7 @@ def excel_serial_to_datetime(x) -> str:
     if isinstance(x, (datetime, date)):
         return x.strftime("%b %d, %Y")
     if isinstance(x, (int, float)) and x:
-        d = datetime(1899, 12, 30) + pd.to_timedelta(float(x), unit="D")
+        d = datetime(1899, 12, 30) + timedelta(days=float(x))
         return d.strftime("%b %d, %Y")
     return "—"
 
@@ -119,21 +141,132 @@ def money2(x) -> str:
         return str(x)
 
 
-def read_range(ws, min_row, max_row, min_col, max_col):
-    return [
-        [ws.cell(r, c).value for c in range(min_col, max_col + 1)]
-        for r in range(min_row, max_row + 1)
-    ]
+def _kpi_money0(x) -> str:
+    """money0 for KPI scalars: a number, None, or text (e.g. a cached #REF!) shown as-is."""
+    if isinstance(x, (int, float)):
+        return f"₹{x:,.0f}"
+    return "₹0" if x is None else str(x)
+
+
+def _kpi_money2(x) -> str:
+    """money2 for KPI scalars: a number, None, or text (e.g. a cached #REF!) shown as-is."""
+    if isinstance(x, (int, float)):
+        return f"₹{x:,.2f}"
+    return "₹0.00" if x is None else str(x)
+
+
+def coordinate_to_tuple(address: str) -> tuple[int, int]:
+    """'G10' -> (10, 7), 1-based like openpyxl's helper of the same name."""
+    m = re.fullmatch(r"([A-Za-z]+)(\d+)", address)
+    if not m:
+        raise ValueError(f"Invalid cell address: {address!r}")
+    col = 0
+    for ch in m.group(1).upper():
+        col = col * 26 + ord(ch) - ord("A") + 1
+    return int(m.group(2)), col
+
+
+def sheet_extent(
+    cells: list[str], blocks: list[tuple[tuple[int, int], tuple[int, int]]]
+) -> tuple[int, int]:
+    """(max_row, max_col) covering the given cell addresses and (data_rows, cols) blocks."""
+    coords = [coordinate_to_tuple(a) for a in cells]
+    max_row = max([r for r, _ in coords] + [rows[1] for rows, _ in blocks])
+    max_col = max([c for _, c in coords] + [cols[1] for _, cols in blocks])
+    return max_row, max_col
+
+
+def load_sheets(xlsx: Path, cache_dir: Path) -> dict[str, pd.DataFrame]:
+    """Header-less frames for every sheet the dashboard reads, cached on disk.
+
+    Parsing the workbook is the slowest step of a build, so the parsed sheets
+    are pickled under cache_dir keyed by the input's mtime and size plus the
+    sheet names and parse settings. Rebuilds from an unchanged workbook skip
+    Excel parsing entirely; an unreadable cache file is treated as a miss, and
+    older cache files are removed when a new one is written.
+    """
+    sheet_names = (SHEET_SUMMARY, SHEET_DASHBOARD, SHEET_INVENTORY, SHEET_SALES)
+    st = xlsx.stat()
+    opts = hashlib.sha1(
+        repr((EXCEL_ENGINE, SHEET_PARSE_OPTS, sheet_names)).encode()
+    ).hexdigest()[:12]
+    cache_file = cache_dir / f"sheets_{opts}_{st.st_mtime_ns}_{st.st_size}.pkl"
+    if cache_file.exists():
+        try:
+            return pd.read_pickle(cache_file)
+        except Exception:
+            pass  # truncated or written by another pandas version; re-parse
+
+    with pd.ExcelFile(xlsx, engine=EXCEL_ENGINE) as xl:
+        sheets = {
+            name: xl.parse(name, **SHEET_PARSE_OPTS)
+            for name in sheet_names
+            if name in xl.sheet_names
+        }
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for old in cache_dir.glob("sheets_*.pkl"):
+        old.unlink()
+    # Write to a temp file and rename, so an interrupted build never leaves a
+    # partial pickle at the keyed path
+    fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            pd.to_pickle(sheets, fp)
+        os.replace(tmp_name, cache_file)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return sheets
+
+
+def sheet_grid(raw: pd.DataFrame, max_row: int, max_col: int) -> pd.DataFrame:
+    """Top-left max_row x max_col block of a header-less sheet.
+
+    Positions match the worksheet (A1 is .iat[0, 0]) and blank cells come back
+    as None.
+    """
+    df = raw.reindex(index=range(max_row), columns=range(max_col)).astype(object)
+    return df.where(df.notna(), None)
+
+
+def with_header(raw: pd.DataFrame) -> pd.DataFrame:
+    """Use the first row of a header-less sheet as its column names."""
+    if raw.empty:
+        return pd.DataFrame()
+    return pd.DataFrame(raw.iloc[1:].to_numpy().tolist(), columns=list(raw.iloc[0]))
+
+
+def cell_value(sheet_df: pd.DataFrame, address: str):
+    r, c = coordinate_to_tuple(address)
+    return sheet_df.iat[r - 1, c - 1]
 
 
-def df_from_range(
-    ws, header_row: int, data_rows: tuple[int, int], cols: tuple[int, int]
+def read_block(
+    sheet_df: pd.DataFrame, header_row: int, data_rows: tuple[int, int], cols: tuple[int, int]
 ) -> pd.DataFrame:
-    headers = read_range(ws, header_row, header_row, cols[0], cols[1])[0]
-    data = read_range(ws, data_rows[0], data_rows[1], cols[0], cols[1])
+    lo, hi = cols[0] - 1, cols[1]
+    headers = list(sheet_df.iloc[header_row - 1, lo:hi])
+    data = sheet_df.iloc[data_rows[0] - 1 : data_rows[1], lo:hi].to_numpy().tolist()
     return pd.DataFrame(data, columns=headers)
 
 
+@lru_cache(maxsize=4)
+def _load_template(path_str: str, mtime: float) -> Template:
+    """Parse and compile a Jinja template, reused until the file's mtime changes."""
+    return Template(Path(path_str).read_text(encoding="utf-8"))
+
+
+def load_template(path: Path) -> Template:
+    return _load_template(str(path), path.stat().st_mtime)
+
+
+def render_to_file(tpl: Template, path: Path, **context) -> None:
+    """Stream a rendered template to disk in UTF-8 without building one big string."""
+    with open(path, "wb") as fp:
+        tpl.stream(**context).dump(fp, encoding="utf-8")
+
+
 def _num(x) -> float:
     """Coerce a cell value to float, returning 0.0 for None/NaN/non-numeric."""
     try:
@@ -210,12 +343,9 @@ def update_history(
     return history
 
 
-def load_sales_df(ws_sales) -> pd.DataFrame:
-    """Read the Sales worksheet into a DataFrame, dropping fully-empty rows."""
-    rows = list(ws_sales.values)
-    if not rows:
-        return pd.DataFrame()
-    df = pd.DataFrame(rows[1:], columns=rows[0])
+def load_sales_df(raw: pd.DataFrame) -> pd.DataFrame:
+    """Build the Sales DataFrame from its raw sheet, dropping fully-empty rows."""
+    df = with_header(raw)
     # drop rows where every cell is None/NaN
     df = df.dropna(how="all").reset_index(drop=True)
     return df
@@ -243,9 +373,9 @@ def compute_sales_kpis(df: pd.DataFrame, status_label: str) -> list[dict]:
     if df.empty:
         return [
             {"label": "Total Records", "value": "0", "hint": f"No {status_label.lower()} sales"},
-            {"label": "Total Amount", "value": money0(0), "hint": "Sum of Amount (₹)"},
-            {"label": "Average Sale", "value": money0(0), "hint": "Mean per record"},
-            {"label": "Largest Sale", "value": money0(0), "hint": "Max Amount (₹)"},
+            {"label": "Total Amount", "value": _kpi_money0(0), "hint": "Sum of Amount (₹)"},
+            {"label": "Average Sale", "value": _kpi_money0(0), "hint": "Mean per record"},
+            {"label": "Largest Sale", "value": _kpi_money0(0), "hint": "Max Amount (₹)"},
         ]
 
     amounts = pd.to_numeric(df.get("Amount (₹)", pd.Series(dtype=float)), errors="coerce").fillna(0)
@@ -269,9 +399,9 @@ def compute_sales_kpis(df: pd.DataFrame, status_label: str) -> list[dict]:
             date_kpi = {"label": "Oldest Pending", "value": "—", "hint": "No dated entries"}
         return [
             {"label": "Pending Count", "value": str(len(df)), "hint": "Records in this view"},
-            {"label": "Pending Amount", "value": money0(total_amount), "hint": "Sum of Amount (₹)"},
+            {"label": "Pending Amount", "value": _kpi_money0(total_amount), "hint": "Sum of Amount (₹)"},
             date_kpi,
-            {"label": "Average Pending", "value": money0(avg_amount), "hint": "Mean per record"},
+            {"label": "Average Pending", "value": _kpi_money0(avg_amount), "hint": "Mean per record"},
         ]
 
     # Completed page
@@ -281,32 +411,214 @@ def compute_sales_kpis(df: pd.DataFrame, status_label: str) -> list[dict]:
 
     return [
         {"label": "Total Records", "value": str(len(df)), "hint": "Completed sales"},
-        {"label": "Total Amount", "value": money0(total_amount), "hint": "Sum of Amount (₹)"},
-        {"label": "This Month", "value": money0(this_month_total), "hint": now.strftime("%b %Y")},
-        {"label": "Largest Sale", "value": money0(max_amount), "hint": "Max Amount (₹)"},
+        {"label": "Total Amount", "value": _kpi_money0(total_amount), "hint": "Sum of Amount (₹)"},
+        {"label": "This Month", "value": _kpi_money0(this_month_total), "hint": now.strftime("%b %Y")},
+        {"label": "Largest Sale", "value": _kpi_money0(max_amount), "hint": "Max Amount (₹)"},
     ]
 
 
+# Column headings matching this are formatted as ₹ amounts in summary tables
+_CURRENCY_RE = re.compile(
+    r"₹|amount|value|paid|balance|target|excess|collected|transferred|share", re.I
+)
+
+
 def format_df_currency(df: pd.DataFrame) -> tuple[list[dict], list[str]]:
-    df2 = df.copy()
-    for col in df2.columns:
-        col_s = str(col)
-        if "₹" in col_s or any(
-            k in col_s.lower()
-            for k in [
-                "amount",
-                "value",
-                "paid",
-                "balance",
-                "target",
-                "excess",
-                "collected",
-                "transferred",
-                "share",
-            ]
-        ):
-            df2[col] = df2[col].apply(money2)
-    return df2.to_dict(orient="records"), list(df2.columns)
+    """Format currency columns for display. Rewrites those columns of df in place."""
+    for col in list(df.columns):
+        if _CURRENCY_RE.search(str(col)):
+            s = pd.to_numeric(df[col], errors="coerce").fillna(0.0)
+            df[col] = ["₹{:,.2f}".format(v) for v in s.to_numpy()]
+    return df.to_dict(orient="records"), list(df.columns)
+
+
+def render_table_html(cols: list[str], records: list[dict]) -> str:
+    """Render <thead>/<tbody> markup for a summary table.
+
+    Built in Python rather than with nested Jinja loops; the last column
+    carries the settle-col class used by the dashboard styles and scripts.
+    """
+    last = len(cols) - 1
+
+    def cell(tag: str, i: int, value) -> str:
+        cls = ' class="settle-col"' if i == last else ""
+        return f"<{tag}{cls}>{escape(str(value))}</{tag}>"
+
+    head = "".join(cell("th", i, c) for i, c in enumerate(cols))
+    body = "".join(
+        f"<tr>{''.join(cell('td', i, r[c]) for i, c in enumerate(cols))}</tr>"
+        for r in records
+    )
+    return f"<thead><tr>{head}</tr></thead><tbody>{body}</tbody>"
+
+
+# ---------------------------
+# Inline SVG charts
+# ---------------------------
+SVG_W, SVG_H = 600, 300
+SVG_PAD_L, SVG_PAD_R, SVG_PAD_T, SVG_PAD_B = 56, 16, 36, 64
+
+# Month-filter windows (Last 3M / Last 6M / All) — must match the filter buttons
+MONTH_WINDOWS = (3, 6, 0)
+
+
+def _nice_ticks(lo: float, hi: float, n: int = 5) -> list[float]:
+    """Evenly spaced 1/2/2.5/5 x 10^k axis ticks covering [lo, hi]."""
+    if hi <= lo:
+        hi = lo + 1
+    raw = (hi - lo) / (n - 1)
+    mag = 10 ** math.floor(math.log10(raw))
+    step = next(m * mag for m in (1, 2, 2.5, 5, 10) if m * mag >= raw)
+    start = math.floor(lo / step) * step
+    count = math.ceil(round((hi - start) / step, 9))
+    return [start + i * step for i in range(count + 1)]
+
+
+def _short_num(v: float) -> str:
+    a = abs(v)
+    if a >= 1_000_000:
+        return f"{v / 1_000_000:g}M"
+    if a >= 1_000:
+        return f"{v / 1_000:g}k"
+    return f"{v:g}"
+
+
+def _svg_frame(
+    title: str, labels: list[str], ticks: list[float], legend: list[tuple[str, str]]
+) -> list[str]:
+    """Title, y gridlines/ticks, x labels and legend shared by every SVG chart."""
+    x0, x1 = SVG_PAD_L, SVG_W - SVG_PAD_R
+    lo, hi = ticks[0], ticks[-1]
+    band = (x1 - x0) / max(len(labels), 1)
+    parts = [
+        f'<svg viewBox="0 0 {SVG_W} {SVG_H}" xmlns="http://www.w3.org/2000/svg" '
+        f'font-size="11" fill="#6b7280">',
+        f'<text x="{SVG_W / 2}" y="20" text-anchor="middle" font-size="14" '
+        f'fill="#111827">{escape(title)}</text>',
+    ]
+    for t in ticks:
+        y = _svg_y(t, lo, hi)
+        stroke = "#9ca3af" if t == 0 else "#e5e7eb"
+        parts.append(
+            f'<line x1="{x0}" x2="{x1}" y1="{y:.1f}" y2="{y:.1f}" stroke="{stroke}"/>'
+            f'<text x="{x0 - 6}" y="{y + 4:.1f}" text-anchor="end">{_short_num(t)}</text>'
+        )
+    label_y = SVG_H - SVG_PAD_B + 16
+    parts.extend(
+        f'<text x="{x0 + band * (i + 0.5):.1f}" y="{label_y}" text-anchor="middle">'
+        f"{escape(label)}</text>"
+        for i, label in enumerate(labels)
+    )
+    if len(legend) > 1:
+        lx = SVG_W / 2 - 50 * len(legend)
+        for name, color in legend:
+            parts.append(
+                f'<rect x="{lx:.1f}" y="{SVG_H - 22}" width="10" height="10" rx="2" fill="{color}"/>'
+                f'<text x="{lx + 14:.1f}" y="{SVG_H - 13}">{escape(name)}</text>'
+            )
+            lx += 100
+    return parts
+
+
+def _svg_y(v: float, lo: float, hi: float) -> float:
+    y0, y1 = SVG_PAD_T, SVG_H - SVG_PAD_B
+    return y1 - (v - lo) / (hi - lo) * (y1 - y0)
+
+
+def bars_svg(
+    labels,
+    series: dict[str, list],
+    colors: list[str],
+    title: str,
+    stacked: bool = False,
+) -> str:
+    """Grouped (or stacked) bar chart as an inline <svg> string."""
+    labels = [str(x) for x in labels]
+    names = list(series)
+    values = [[_num(v) for v in series[n]] for n in names]
+    if stacked:
+        cols = list(zip(*values)) or [()]
+        lo = min(0.0, min(sum(v for v in c if v < 0) for c in cols))
+        hi = max(0.0, max(sum(v for v in c if v > 0) for c in cols))
+    else:
+        flat = [v for vs in values for v in vs] or [0.0]
+        lo, hi = min(0.0, min(flat)), max(0.0, max(flat))
+    ticks = _nice_ticks(lo, hi)
+    lo, hi = ticks[0], ticks[-1]
+
+    parts = _svg_frame(title, labels, ticks, list(zip(names, colors)))
+    band = (SVG_W - SVG_PAD_L - SVG_PAD_R) / max(len(labels), 1)
+    bar_w = band * 0.7 / (1 if stacked else max(len(names), 1))
+    for i, label in enumerate(labels):
+        left = SVG_PAD_L + band * (i + 0.15)
+        pos = neg = 0.0
+        for k, (name, color) in enumerate(zip(names, colors)):
+            v = values[k][i]
+            if stacked:
+                base = pos if v >= 0 else neg
+                a, b = base, base + v
+                if v >= 0:
+                    pos += v
+                else:
+                    neg += v
+                x = left
+            else:
+                a, b = 0.0, v
+                x = left + k * bar_w
+            y_top, y_bot = _svg_y(max(a, b), lo, hi), _svg_y(min(a, b), lo, hi)
+            parts.append(
+                f'<rect x="{x:.1f}" y="{y_top:.1f}" width="{bar_w:.1f}" '
+                f'height="{y_bot - y_top:.1f}" fill="{color}">'
+                f"<title>{escape(label)} · {escape(name)}: {v:,.0f}</title></rect>"
+            )
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+def line_svg(labels, values, color: str, title: str) -> str:
+    """Single-series line chart with point markers as an inline <svg> string."""
+    labels = [str(x) for x in labels]
+    vals = [_num(v) for v in values]
+    ticks = _nice_ticks(min([0.0, *vals]), max([0.0, *vals]))
+    lo, hi = ticks[0], ticks[-1]
+
+    parts = _svg_frame(title, labels, ticks, [])
+    band = (SVG_W - SVG_PAD_L - SVG_PAD_R) / max(len(labels), 1)
+    pts = [
+        (SVG_PAD_L + band * (i + 0.5), _svg_y(v, lo, hi)) for i, v in enumerate(vals)
+    ]
+    if pts:
+        path = " ".join(f"{x:.1f},{y:.1f}" for x, y in pts)
+        parts.append(
+            f'<polyline points="{path}" fill="none" stroke="{color}" stroke-width="2.5"/>'
+        )
+    parts.extend(
+        f'<circle cx="{x:.1f}" cy="{y:.1f}" r="4" fill="{color}">'
+        f"<title>{escape(label)}: {v:,.0f}</title></circle>"
+        for (x, y), label, v in zip(pts, labels, vals)
+    )
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+def month_windows_html(month_df: pd.DataFrame, render) -> str:
+    """Pre-render a monthly chart once per filter window.
+
+    Months with neither purchases nor sales are dropped first; the page's
+    Last 3M / Last 6M / All buttons just toggle which copy is visible.
+    """
+    df = month_df[month_df["Month"].notna()]
+    purchases = df.get("Purchases (₹)", pd.Series(0, index=df.index))
+    sales = df.get("Sales (₹)", pd.Series(0, index=df.index))
+    with_data = df[(purchases != 0) | (sales != 0)]
+    out = []
+    for n in MONTH_WINDOWS:
+        window = with_data.tail(n) if 0 < n < len(with_data) else with_data
+        hidden = " hidden" if n else ""
+        out.append(
+            f'<div class="svg-chart month-window" data-n="{n}"{hidden}>{render(window)}</div>'
+        )
+    return "".join(out)
 
 
 # ---------------------------
@@ -315,51 +627,84 @@ def format_df_currency(df: pd.DataFrame) -> tuple[list[dict], list[str]]:
 def build(input_xlsx: Path, template_path: Path, dist_dir: Path) -> None:
     dist_dir.mkdir(parents=True, exist_ok=True)
 
+    # Copy excel for download button; pure I/O, so it runs alongside the build
+    excel_filename = f"Chiraath-Summary-{datetime.now().strftime('%b%y')}.xlsx"
+    copy_pool = ThreadPoolExecutor(max_workers=1)
+    copy_job = copy_pool.submit(shutil.copyfile, input_xlsx, dist_dir / excel_filename)
+    copy_pool.shutdown(wait=False)
+
     root = template_path.parent.parent
     inventory_template_path = root / "src" / "inventory_template.html"
     sales_template_path = root / "src" / "sales_template.html"
     history_path = root / "data" / "history.json"
-
-    wb = openpyxl.load_workbook(input_xlsx, data_only=True)
-    ws_sum = wb[SHEET_SUMMARY]
-    ws_dash = wb[SHEET_DASHBOARD]
-    ws_inventory = wb[SHEET_INVENTORY]
-    ws_sales = wb[SHEET_SALES] if SHEET_SALES in wb.sheetnames else None
+    cache_dir = root / ".cache"
+
+    # Each sheet is parsed once (or loaded from the cache); KPI cells and
+    # tables are sliced out of the parsed frames
+    sheets = load_sheets(input_xlsx, cache_dir)
+
+    sum_df = sheet_grid(
+        sheets[SHEET_SUMMARY],
+        *sheet_extent(
+            [
+                CELL_TOTAL_PURCHASES,
+                CELL_TOTAL_SALES_COMPLETED,
+                CELL_PROFIT_LOSS_COMPLETED,
+                CELL_PROFIT_STATUS,
+            ],
+            [(CONTRIB_DATA_ROWS, CONTRIB_COLS), (CASH_DATA_ROWS, CASH_COLS)],
+        ),
+    )
+    dash_df = sheet_grid(
+        sheets[SHEET_DASHBOARD],
+        *sheet_extent(
+            [CELL_PENDING_STOCK_VALUE, CELL_QTY_SOLD, CELL_QTY_PENDING],
+            [
+                (MONTH_DATA_ROWS, MONTH_COLS),
+                (CATQTY_DATA_ROWS, CATQTY_COLS),
+                (PENDVAL_DATA_ROWS, PENDVAL_COLS),
+            ],
+        ),
+    )
 
     # KPIs
-    total_purchases = ws_sum[CELL_TOTAL_PURCHASES].value
-    total_sales_completed = ws_sum[CELL_TOTAL_SALES_COMPLETED].value
-    profit_loss = ws_sum[CELL_PROFIT_LOSS_COMPLETED].value
-    profit_status = ws_sum[CELL_PROFIT_STATUS].value
+    total_purchases = cell_value(sum_df, CELL_TOTAL_PURCHASES)
+    total_sales_completed = cell_value(sum_df, CELL_TOTAL_SALES_COMPLETED)
+    profit_loss = cell_value(sum_df, CELL_PROFIT_LOSS_COMPLETED)
+    profit_status = cell_value(sum_df, CELL_PROFIT_STATUS)
 
     last_updated = datetime.now().strftime("%b %d, %Y %I:%M %p")
-    pending_stock_value = ws_dash[CELL_PENDING_STOCK_VALUE].value
-    qty_sold = ws_dash[CELL_QTY_SOLD].value
-    qty_pending = ws_dash[CELL_QTY_PENDING].value
+    pending_stock_value = cell_value(dash_df, CELL_PENDING_STOCK_VALUE)
+    qty_sold = cell_value(dash_df, CELL_QTY_SOLD)
+    qty_pending = cell_value(dash_df, CELL_QTY_PENDING)
 
     # Tables
-    contrib_df = df_from_range(
-        ws_sum, CONTRIB_HEADER_ROW, CONTRIB_DATA_ROWS, CONTRIB_COLS
+    contrib_df = read_block(
+        sum_df, CONTRIB_HEADER_ROW, CONTRIB_DATA_ROWS, CONTRIB_COLS
     )
     contrib_df = contrib_df.iloc[:, [0, -2, -1]]
 
-    cash_df = df_from_range(ws_sum, CASH_HEADER_ROW, CASH_DATA_ROWS, CASH_COLS)
+    cash_df = read_block(sum_df, CASH_HEADER_ROW, CASH_DATA_ROWS, CASH_COLS)
     cash_df = cash_df.iloc[:, [0, -2, -1]]
 
-    month_df = df_from_range(ws_dash, MONTH_HEADER_ROW, MONTH_DATA_ROWS, MONTH_COLS)
-    for c in ["Purchases (₹)", "Sales (₹)", MONTH_PROFIT_COL]:
-        if c in month_df.columns:
-            month_df[c] = pd.to_numeric(month_df[c], errors="coerce").fillna(0)
+    month_df = read_block(dash_df, MONTH_HEADER_ROW, MONTH_DATA_ROWS, MONTH_COLS)
+    num_cols = [
+        c for c in ["Purchases (₹)", "Sales (₹)", MONTH_PROFIT_COL] if c in month_df.columns
+    ]
+    if num_cols:
+        month_df[num_cols] = month_df[num_cols].apply(pd.to_numeric, errors="coerce").fillna(0)
 
-    cat_qty_df = df_from_range(
-        ws_dash, CATQTY_HEADER_ROW, CATQTY_DATA_ROWS, CATQTY_COLS
+    cat_qty_df = read_block(
+        dash_df, CATQTY_HEADER_ROW, CATQTY_DATA_ROWS, CATQTY_COLS
     )
-    for c in ["Qty Sold", "Qty Pending"]:
-        if c in cat_qty_df.columns:
-            cat_qty_df[c] = pd.to_numeric(cat_qty_df[c], errors="coerce").fillna(0)
+    num_cols = [c for c in ["Qty Sold", "Qty Pending"] if c in cat_qty_df.columns]
+    if num_cols:
+        cat_qty_df[num_cols] = (
+            cat_qty_df[num_cols].apply(pd.to_numeric, errors="coerce").fillna(0)
+        )
 
-    pending_val_df = df_from_range(
-        ws_dash, PENDVAL_HEADER_ROW, PENDVAL_DATA_ROWS, PENDVAL_COLS
+    pending_val_df = read_block(
+        dash_df, PENDVAL_HEADER_ROW, PENDVAL_DATA_ROWS, PENDVAL_COLS
     )
     if "Pending Value (₹)" in pending_val_df.columns:
         pending_val_df["Pending Value (₹)"] = pd.to_numeric(
@@ -367,11 +712,7 @@ def build(input_xlsx: Path, template_path: Path, dist_dir: Path) -> None:
         ).fillna(0)
 
     # Inventory source data
-    inventory_rows = list(ws_inventory.values)
-    if inventory_rows:
-        inventory_source_df = pd.DataFrame(inventory_rows[1:], columns=inventory_rows[0])
-    else:
-        inventory_source_df = pd.DataFrame()
+    inventory_source_df = with_header(sheets[SHEET_INVENTORY])
 
     # Inventory table columns to display
     desired_inventory_cols = [
@@ -443,120 +784,64 @@ def build(input_xlsx: Path, template_path: Path, dist_dir: Path) -> None:
         inventory_low_stock = 0
         inventory_sold_out = 0
 
-    # Charts
-    charts = {}
-    PLOTLY_CONFIG = {"responsive": True, "displayModeBar": False}
+    # Charts: inline SVG markup, except the history trend which is Plotly
+    # figure JSON drawn client-side (None = unavailable)
+    charts: dict[str, str | None] = {}
+    month_cols = set(month_df.columns)
+    cat_cols = set(cat_qty_df.columns)
+    pend_cols = set(pending_val_df.columns)
 
-    if {"Month", "Purchases (₹)", "Sales (₹)"}.issubset(set(month_df.columns)):
-        fig_month = go.Figure()
-        fig_month.add_trace(
-            go.Bar(x=month_df["Month"], y=month_df["Purchases (₹)"], name="Purchases",
-                   marker_color=C_INDIGO)
-        )
-        fig_month.add_trace(
-            go.Bar(x=month_df["Month"], y=month_df["Sales (₹)"], name="Sales",
-                   marker_color=C_GREEN)
-        )
-        fig_month.update_layout(
-            barmode="group",
-            title="Monthly Purchases vs Sales",
-            margin=dict(l=40, r=20, t=50, b=80),
-            legend=dict(orientation="h", yanchor="top", y=-0.18, xanchor="center", x=0.5),
-        )
-        charts["month"] = pio.to_html(
-            fig_month,
-            include_plotlyjs="cdn",
-            full_html=False,
-            config=PLOTLY_CONFIG,
-            div_id="chart-month",
+    if _MONTH_REQ <= month_cols:
+        charts["month"] = month_windows_html(
+            month_df,
+            lambda df: bars_svg(
+                df["Month"],
+                {"Purchases": df["Purchases (₹)"], "Sales": df["Sales (₹)"]},
+                [C_INDIGO, C_GREEN],
+                "Monthly Purchases vs Sales",
+            ),
         )
     else:
-        charts["month"] = (
-            "<div style='color:#6b7280;font-size:13px'>"
-            "Monthly chart unavailable (columns changed)."
-            "</div>"
-        )
+        charts["month"] = None
 
-    if {"Month", MONTH_PROFIT_COL}.issubset(set(month_df.columns)):
-        fig_profit = px.line(
+    if _PROFIT_REQ <= month_cols:
+        charts["profit"] = month_windows_html(
             month_df,
-            x="Month",
-            y=MONTH_PROFIT_COL,
-            markers=True,
-            title=f"Monthly {MONTH_PROFIT_COL}",
-        )
-        fig_profit.update_traces(line=dict(color=C_INDIGO, width=2.5), marker=dict(color=C_INDIGO))
-        fig_profit.update_layout(margin=dict(l=40, r=20, t=50, b=40))
-        charts["profit"] = pio.to_html(
-            fig_profit,
-            include_plotlyjs=False,
-            full_html=False,
-            config=PLOTLY_CONFIG,
-            div_id="chart-profit",
+            lambda df: line_svg(
+                df["Month"], df[MONTH_PROFIT_COL], C_INDIGO, f"Monthly {MONTH_PROFIT_COL}"
+            ),
         )
     else:
-        charts["profit"] = (
-            "<div style='color:#6b7280;font-size:13px'>"
-            "Profit chart unavailable (columns changed)."
-            "</div>"
-        )
+        charts["profit"] = None
 
-    if {"Category", "Qty Sold", "Qty Pending"}.issubset(set(cat_qty_df.columns)):
-        fig_cat_qty = go.Figure()
-        fig_cat_qty.add_trace(
-            go.Bar(x=cat_qty_df["Category"], y=cat_qty_df["Qty Sold"], name="Qty Sold",
-                   marker_color=C_GREEN)
-        )
-        fig_cat_qty.add_trace(
-            go.Bar(
-                x=cat_qty_df["Category"],
-                y=cat_qty_df["Qty Pending"],
-                name="Qty Pending",
-                marker_color=C_AMBER,
+    if _CATQTY_REQ <= cat_cols:
+        charts["cat_qty"] = (
+            '<div class="svg-chart">'
+            + bars_svg(
+                cat_qty_df["Category"],
+                {"Qty Sold": cat_qty_df["Qty Sold"], "Qty Pending": cat_qty_df["Qty Pending"]},
+                [C_GREEN, C_AMBER],
+                "Quantity by Category",
+                stacked=True,
             )
-        )
-        fig_cat_qty.update_layout(
-            barmode="stack",
-            title="Quantity by Category",
-            margin=dict(l=40, r=20, t=50, b=80),
-            legend=dict(orientation="h", yanchor="top", y=-0.18, xanchor="center", x=0.5),
-        )
-        charts["cat_qty"] = pio.to_html(
-            fig_cat_qty,
-            include_plotlyjs=False,
-            full_html=False,
-            config=PLOTLY_CONFIG,
-            div_id="chart-cat-qty",
+            + "</div>"
         )
     else:
-        charts["cat_qty"] = (
-            "<div style='color:#6b7280;font-size:13px'>"
-            "Category qty chart unavailable (columns changed)."
-            "</div>"
-        )
+        charts["cat_qty"] = None
 
-    if {"Category", "Pending Value (₹)"}.issubset(set(pending_val_df.columns)):
-        fig_pending_val = px.bar(
-            pending_val_df,
-            x="Category",
-            y="Pending Value (₹)",
-            title="Pending Stock Value by Category (₹)",
-        )
-        fig_pending_val.update_traces(marker_color=C_INDIGO)
-        fig_pending_val.update_layout(margin=dict(l=40, r=20, t=50, b=40))
-        charts["pending_val"] = pio.to_html(
-            fig_pending_val,
-            include_plotlyjs=False,
-            full_html=False,
-            config=PLOTLY_CONFIG,
-            div_id="chart-pending-val",
-        )
-    else:
+    if _PENDVAL_REQ <= pend_cols:
         charts["pending_val"] = (
-            "<div style='color:#6b7280;font-size:13px'>"
-            "Pending value chart unavailable (columns changed)."
-            "</div>"
+            '<div class="svg-chart">'
+            + bars_svg(
+                pending_val_df["Category"],
+                {"Pending Value (₹)": pending_val_df["Pending Value (₹)"]},
+                [C_INDIGO],
+                "Pending Stock Value by Category (₹)",
+            )
+            + "</div>"
         )
+    else:
+        charts["pending_val"] = None
 
     # ── Historical trend (appends today's KPIs to data/history.json) ──
     history = update_history(
@@ -567,52 +852,40 @@ def build(input_xlsx: Path, template_path: Path, dist_dir: Path) -> None:
         pending_stock_value,
     )
 
+    plotlyjs_url = ""
     if len(history) >= 2:
+        # Imported here: plotly is only needed for this chart and is slow to import
+        import plotly.graph_objects as go
+        import plotly.io as pio
+        from plotly.offline import get_plotlyjs_version
+
+        pio.json.config.default_engine = "orjson"
+
+        plotlyjs_url = f"https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"
         hist_df = pd.DataFrame(history)
-        fig_trend = go.Figure()
-        fig_trend.add_trace(
-            go.Scatter(
-                x=hist_df["date"], y=hist_df["total_purchases"],
-                mode="lines+markers", name="Purchases",
-                line=dict(color="#4f46e5", width=2.5),
-            )
-        )
-        fig_trend.add_trace(
-            go.Scatter(
-                x=hist_df["date"], y=hist_df["total_sales"],
-                mode="lines+markers", name="Sales",
-                line=dict(color="#16a34a", width=2.5),
-            )
-        )
-        fig_trend.add_trace(
-            go.Scatter(
-                x=hist_df["date"], y=hist_df["profit_loss"],
-                mode="lines+markers", name="Profit / Loss",
-                line=dict(color="#dc2626", width=2.5),
-            )
-        )
-        fig_trend.update_layout(
-            title="KPI Trend Over Time",
-            margin=dict(l=40, r=20, t=50, b=80),
-            legend=dict(orientation="h", yanchor="top", y=-0.18,
-                        xanchor="center", x=0.5),
-            hovermode="x unified",
-            yaxis_title="₹",
-        )
-        charts["trend"] = pio.to_html(
-            fig_trend,
-            include_plotlyjs=False,
-            full_html=False,
-            config=PLOTLY_CONFIG,
-            div_id="chart-trend",
+        fig_trend = go.Figure(
+            data=[
+                go.Scatter(
+                    x=hist_df["date"], y=hist_df[key],
+                    mode="lines+markers", name=name,
+                    line=dict(color=color, width=2.5),
+                )
+                for key, name, color in [
+                    ("total_purchases", "Purchases", C_INDIGO),
+                    ("total_sales", "Sales", C_GREEN),
+                    ("profit_loss", "Profit / Loss", C_RED),
+                ]
+            ],
+            layout={
+                **PLOTLY_BASE_LAYOUT,
+                "title": "KPI Trend Over Time",
+                "hovermode": "x unified",
+                "yaxis": dict(title=dict(text="₹")),
+            },
         )
+        charts["trend"] = pio.to_json(fig_trend)
     else:
-        charts["trend"] = (
-            "<div style='color:#6b7280;font-size:13px;padding:20px 0'>"
-            "Trend chart will appear after 2+ builds have been recorded. "
-            f"History currently has {len(history)} snapshot(s)."
-            "</div>"
-        )
+        charts["trend"] = None
 
     # ── Profit/Loss KPI colour class ──
     profit_loss_class = "kpi-profit" if _num(profit_loss) >= 0 else "kpi-loss"
@@ -626,14 +899,9 @@ def build(input_xlsx: Path, template_path: Path, dist_dir: Path) -> None:
     contrib_records, contrib_cols = format_df_currency(contrib_df)
     cash_records, cash_cols = format_df_currency(cash_df)
 
-    # Serialize monthly data for the JS month-filter feature
-    month_df_clean = month_df[month_df.iloc[:, 0].notna()].copy()
-    month_data_json = month_df_clean.to_json(orient="records")
-
     # Render HTML
-    tpl_dashboard = Template(template_path.read_text(encoding="utf-8"))
-    tpl_inventory = Template(inventory_template_path.read_text(encoding="utf-8"))
-    excel_filename = f"Chiraath-Summary-{datetime.now().strftime('%b%y')}.xlsx"
+    tpl_dashboard = load_template(template_path)
+    tpl_inventory = load_template(inventory_template_path)
 
     common_context = dict(
         last_updated=last_updated,
@@ -648,14 +916,16 @@ def build(input_xlsx: Path, template_path: Path, dist_dir: Path) -> None:
         excel_filename=excel_filename,
     )
 
-    dashboard_html = tpl_dashboard.render(
+    render_to_file(
+        tpl_dashboard,
+        dist_dir / "index.html",
         **common_context,
-        total_purchases=money0(total_purchases),
-        total_sales_completed=money0(total_sales_completed),
-        profit_loss=money0(profit_loss),
+        total_purchases=_kpi_money0(total_purchases),
+        total_sales_completed=_kpi_money0(total_sales_completed),
+        profit_loss=_kpi_money0(profit_loss),
         profit_loss_class=profit_loss_class,
         profit_status=str(profit_status or ""),
-        pending_stock_value=money2(pending_stock_value),
+        pending_stock_value=_kpi_money2(pending_stock_value),
         mom_purchases=mom_purchases,
         mom_sales=mom_sales,
         mom_profit=mom_profit,
@@ -665,21 +935,17 @@ def build(input_xlsx: Path, template_path: Path, dist_dir: Path) -> None:
         chart_cat_qty=charts["cat_qty"],
         chart_pending_val=charts["pending_val"],
         chart_trend=charts["trend"],
-        contrib_cols=contrib_cols,
-        contrib_records=contrib_records,
-        cash_cols=cash_cols,
-        cash_records=cash_records,
-        month_data_json=month_data_json,
-        month_col_profit=MONTH_PROFIT_COL,
+        history_count=len(history),
+        plotlyjs_url=plotlyjs_url,
+        plotly_config=json.dumps(PLOTLY_CONFIG),
+        contrib_table_html=render_table_html(contrib_cols, contrib_records),
+        cash_table_html=render_table_html(cash_cols, cash_records),
     )
 
-    inventory_html = tpl_inventory.render(**common_context)
-
-    (dist_dir / "index.html").write_text(dashboard_html, encoding="utf-8")
-    (dist_dir / "inventory.html").write_text(inventory_html, encoding="utf-8")
+    render_to_file(tpl_inventory, dist_dir / "inventory.html", **common_context)
 
     # ----- Sales pages (Completed + Pending) -----
-    sales_df = load_sales_df(ws_sales) if ws_sales is not None else pd.DataFrame()
+    sales_df = load_sales_df(sheets.get(SHEET_SALES, pd.DataFrame()))
     if not sales_df.empty and SALES_STATUS_COL in sales_df.columns:
         status_series = sales_df[SALES_STATUS_COL].astype(str).str.strip().str.lower()
         completed_df = sales_df[status_series == "completed"].copy()
@@ -701,10 +967,12 @@ def build(input_xlsx: Path, template_path: Path, dist_dir: Path) -> None:
             by="Date", ascending=True, na_position="last"
         ).reset_index(drop=True)
 
-    tpl_sales = Template(sales_template_path.read_text(encoding="utf-8"))
+    tpl_sales = load_template(sales_template_path)
 
     completed_records, sales_cols = format_sales_for_display(completed_df)
-    completed_html = tpl_sales.render(
+    render_to_file(
+        tpl_sales,
+        dist_dir / "sales-completed.html",
         page_title="Chiraath — Sales Completed",
         page_status_label="Completed",
         page_status_class="completed",
@@ -718,7 +986,9 @@ def build(input_xlsx: Path, template_path: Path, dist_dir: Path) -> None:
     )
 
     pending_records, pending_cols = format_sales_for_display(pending_df)
-    pending_html = tpl_sales.render(
+    render_to_file(
+        tpl_sales,
+        dist_dir / "sales-pending.html",
         page_title="Chiraath — Sales Pending",
         page_status_label="Pending",
         page_status_class="pending",
@@ -731,11 +1001,7 @@ def build(input_xlsx: Path, template_path: Path, dist_dir: Path) -> None:
         note="Pending sales (advance/promised, awaiting collection). Sorted oldest first.",
     )
 
-    (dist_dir / "sales-completed.html").write_text(completed_html, encoding="utf-8")
-    (dist_dir / "sales-pending.html").write_text(pending_html, encoding="utf-8")
-
-    # Copy excel for download button
-    shutil.copyfile(input_xlsx, dist_dir / excel_filename)
+    copy_job.result()  # re-raises any error from the copy
 
     print(f"✅ Built dashboard: {dist_dir / 'index.html'}")
     print(f"✅ Built inventory page: {dist_dir / 'inventory.html'}")